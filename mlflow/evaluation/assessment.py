@@ -139,12 +139,12 @@ class Assessment(_MlflowObject):
             error_message=assessment_dict.get("error_message"),
         )
 
-    def _to_entity(self, evaluation_id: str) -> AssessmentEntity:
+    def _to_entity(self, evaluation_id: str, timestamp: Optional[int] = None) -> AssessmentEntity:
         return AssessmentEntity(
             evaluation_id=evaluation_id,
             name=self._name,
             source=self._source,
-            timestamp=int(time.time() * 1000),
+            timestamp=timestamp if timestamp is not None else int(time.time() * 1000),
             boolean_value=self._boolean_value,
             numeric_value=self._numeric_value,
             string_value=self._string_value,
@@ -1,5 +1,6 @@
 import hashlib
 import json
+import time
 from typing import Any, Dict, List, Optional, Union
 
 from mlflow.entities._mlflow_object import _MlflowObject
@@ -125,6 +126,9 @@ class Evaluation(_MlflowObject):
         Returns:
             EvaluationEntity: An EvaluationEntity object.
         """
+        # Read the clock once so that every assessment in the evaluation shares a consistent
+        # timestamp, rather than making one system call per assessment
+        assessment_timestamp = int(time.time() * 1000)
         return EvaluationEntity(
             evaluation_id=evaluation_id,
             run_id=run_id,
@@ -135,7 +139,10 @@ class Evaluation(_MlflowObject):
             targets=self.targets,
             error_code=self.error_code,
             error_message=self.error_message,
-            assessments=[assess._to_entity(evaluation_id) for assess in self.assessments]
+            assessments=[
+                assess._to_entity(evaluation_id, timestamp=assessment_timestamp)
+                for assess in self.assessments
+            ]
             if self.assessments
             else None,
             metrics=self.metrics,
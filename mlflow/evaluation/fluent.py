@@ -1,11 +1,34 @@
-import uuid
-from typing import List, Optional
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import pandas as pd
 
 from mlflow.entities.evaluation import Evaluation as EvaluationEntity
 from mlflow.evaluation.evaluation import Evaluation
 from mlflow.evaluation.utils import evaluations_to_dataframes
+from mlflow.tracking._tracking_service.utils import _resolve_tracking_uri
 from mlflow.tracking.client import MlflowClient
 from mlflow.tracking.fluent import _get_or_start_run
+from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_ARTIFACTS
+
+
+@lru_cache(maxsize=100)
+def _get_client_for_tracking_uri(tracking_uri: str) -> MlflowClient:
+    return MlflowClient(tracking_uri)
+
+
+def _get_client() -> MlflowClient:
+    """
+    Returns an MlflowClient for the currently-configured tracking URI, reusing a previously
+    constructed client where possible. Caching is done on resolved URIs because the meaning of
+    an unresolved (None) URI may change depending on external configuration, such as environment
+    variables.
+    """
+    return _get_client_for_tracking_uri(_resolve_tracking_uri())
 
 
 def log_evaluations(
@@ -22,21 +45,87 @@ def log_evaluations(
     Returns:
       List[EvaluationEntity]: The logged Evaluation objects.
     """
-    run_id = run_id if run_id is not None else _get_or_start_run().info.run_id
+    # Return before resolving the run so that logging an empty batch doesn't start a run or
+    # construct a client as a side effect
     if not evaluations:
         return []
 
-    client = MlflowClient()
+    run_id = run_id if run_id is not None else _get_or_start_run().info.run_id
+    client = _get_client()
+    # Draw the randomness for every evaluation ID with one os.urandom read rather than one
+    # call per uuid4
+    id_bytes = os.urandom(16 * len(evaluations))
     evaluation_entities = [
-        evaluation._to_entity(run_id=run_id, evaluation_id=uuid.uuid4().hex)
-        for evaluation in evaluations
+        evaluation._to_entity(run_id=run_id, evaluation_id=id_bytes[16 * i : 16 * (i + 1)].hex())
+        for i, evaluation in enumerate(evaluations)
     ]
     evaluations_df, metrics_df, assessments_df, tags_df = evaluations_to_dataframes(
         evaluation_entities
     )
-    client.log_table(run_id=run_id, data=evaluations_df, artifact_file="_evaluations.json")
-    client.log_table(run_id=run_id, data=metrics_df, artifact_file="_metrics.json")
-    client.log_table(run_id=run_id, data=assessments_df, artifact_file="_assessments.json")
-    client.log_table(run_id=run_id, data=tags_df, artifact_file="_tags.json")
+    # In the common case where evaluations are logged without metrics, assessments, or tags,
+    # skip the artifact round trips for the empty tables; readers treat a missing table
+    # artifact as an empty table
+    tables = {
+        artifact_file: data
+        for artifact_file, data in [
+            ("_evaluations.json", evaluations_df),
+            ("_metrics.json", metrics_df),
+            ("_assessments.json", assessments_df),
+            ("_tags.json", tags_df),
+        ]
+        if artifact_file == "_evaluations.json" or not data.empty
+    }
+    _log_evaluation_tables(client=client, run_id=run_id, tables=tables)
 
     return evaluation_entities
+
+
+def _log_evaluation_tables(
+    *, client: MlflowClient, run_id: str, tables: Dict[str, pd.DataFrame]
+) -> None:
+    """
+    Logs the specified evaluation tables to an MLflow Run as JSON table artifacts, appending to
+    any of the table artifacts that already exist in the run.
+
+    This is equivalent to calling :py:meth:`MlflowClient.log_table` once per table, but writes
+    the table artifacts concurrently and records all of them in the run's logged-artifacts tag
+    with a single tag update, rather than serially round-tripping to the tracking server once
+    per table.
+
+    Args:
+        client (MlflowClient): The MLflow client to use for logging.
+        run_id (str): ID of the MLflow Run to log the tables to.
+        tables (Dict[str, pd.DataFrame]): Mapping of run-relative artifact file name to the
+            table contents to log.
+    """
+    existing_artifacts = {file.path for file in client.list_artifacts(run_id)}
+
+    def log_table(artifact_file: str, data: pd.DataFrame) -> None:
+        if artifact_file in existing_artifacts:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                downloaded_path = client.download_artifacts(
+                    run_id=run_id, path=artifact_file, dst_path=tmpdir
+                )
+                data = pd.concat([client._read_from_file(downloaded_path), data], ignore_index=True)
+        with client._log_artifact_helper(run_id, artifact_file) as artifact_path:
+            data.to_json(artifact_path, orient="split", index=False, date_format="iso")
+
+    with ThreadPoolExecutor(
+        max_workers=len(tables), thread_name_prefix="MlflowLogEvaluations"
+    ) as executor:
+        futures = [
+            executor.submit(log_table, artifact_file, data)
+            for artifact_file, data in tables.items()
+        ]
+        for future in futures:
+            future.result()
+
+    run = client.get_run(run_id)
+    logged_artifacts = json.loads(run.data.tags.get(MLFLOW_LOGGED_ARTIFACTS, "[]"))
+    new_entries = [
+        {"path": artifact_file, "type": "table"}
+        for artifact_file in tables
+        if {"path": artifact_file, "type": "table"} not in logged_artifacts
+    ]
+    if new_entries:
+        client.set_tag(run_id, MLFLOW_LOGGED_ARTIFACTS, json.dumps(logged_artifacts + new_entries))
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 import mlflow
@@ -5,6 +7,7 @@ from mlflow.entities import Metric
 from mlflow.entities.assessment_source import AssessmentSource, AssessmentSourceType
 from mlflow.entities.evaluation_tag import EvaluationTag
 from mlflow.evaluation import Assessment, Evaluation, log_evaluations
+from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_ARTIFACTS
 
 from tests.evaluate.logging.utils import get_evaluation
 
@@ -180,6 +183,59 @@ def test_log_evaluations_with_all_params():
             assert logged_evaluation == retrieved_evaluation
 
 
+def test_log_evaluations_twice_to_same_run_appends_tables_and_dedupes_tag():
+    inputs1 = {"feature1": 1.0, "feature2": 2.0}
+    outputs1 = {"prediction": 0.5}
+
+    inputs2 = {"feature3": 3.0, "feature4": 4.0}
+    outputs2 = {"prediction": 0.8}
+
+    with mlflow.start_run() as run:
+        run_id = run.info.run_id
+
+        # The first batch has no metrics, assessments, or tags, so only the evaluations table
+        # artifact is created
+        first_logged = log_evaluations(
+            evaluations=[Evaluation(inputs=inputs1, outputs=outputs1)], run_id=run_id
+        )[0]
+
+        # The second batch appends to the evaluations table and creates the remaining tables
+        second_logged = log_evaluations(
+            evaluations=[
+                Evaluation(
+                    inputs=inputs2,
+                    outputs=outputs2,
+                    assessments=[
+                        Assessment(
+                            name="accuracy",
+                            value=0.9,
+                            source=AssessmentSource(
+                                source_type=AssessmentSourceType.HUMAN, source_id="user-1"
+                            ),
+                        )
+                    ],
+                    metrics={"metric1": 1.5},
+                    tags={"tag1": "value1"},
+                )
+            ],
+            run_id=run_id,
+        )[0]
+
+        # Evaluations from both batches are retrievable after the append
+        first_retrieved = get_evaluation(evaluation_id=first_logged.evaluation_id, run_id=run_id)
+        assert first_retrieved.inputs == first_logged.inputs
+        assert first_retrieved.outputs == first_logged.outputs
+        second_retrieved = get_evaluation(evaluation_id=second_logged.evaluation_id, run_id=run_id)
+        assert second_retrieved == second_logged
+
+        # Each table artifact is recorded in the logged-artifacts tag exactly once
+        tags = mlflow.MlflowClient().get_run(run_id).data.tags
+        logged_artifacts = json.loads(tags[MLFLOW_LOGGED_ARTIFACTS])
+        table_files = ["_evaluations.json", "_metrics.json", "_assessments.json", "_tags.json"]
+        for artifact_file in table_files:
+            assert logged_artifacts.count({"path": artifact_file, "type": "table"}) == 1
+
+
 def test_log_evaluations_starts_run_if_not_started(end_run_at_test_end):
     inputs = {"feature1": 1.0, "feature2": {"nested_feature": 2.0}}
     outputs = {"prediction": 0.5}
@@ -218,3 +274,12 @@ def test_log_evaluations_works_properly_with_empty_evaluations_list():
 
         artifacts = mlflow.MlflowClient().list_artifacts(mlflow.active_run().info.run_id)
         assert len(artifacts) == 0
+
+
+def test_log_evaluations_with_empty_evaluations_list_does_not_start_run():
+    # Ensure there is no active run
+    if mlflow.active_run() is not None:
+        mlflow.end_run()
+
+    assert log_evaluations(evaluations=[]) == []
+    assert mlflow.active_run() is None
@@ -1,10 +1,16 @@
-from typing import List
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Set
 
 import pandas as pd
 
 from mlflow.entities.evaluation import Evaluation as EvaluationEntity
 from mlflow.evaluation.utils import (
     _get_assessments_dataframe_schema,
+    _get_empty_assessments_dataframe,
+    _get_empty_evaluations_dataframe,
+    _get_empty_metrics_dataframe,
+    _get_empty_tags_dataframe,
     _get_evaluations_dataframe_schema,
     _get_metrics_dataframe_schema,
     _get_tags_dataframe_schema,
@@ -26,24 +32,38 @@ def get_evaluation(*, run_id: str, evaluation_id: str) -> EvaluationEntity:
         Evaluation: The Evaluation object.
     """
     client = MlflowClient()
-    if not _contains_evaluation_artifacts(client=client, run_id=run_id):
+    artifact_paths = {file.path for file in client.list_artifacts(run_id)}
+    if not _contains_evaluation_artifacts(artifact_paths=artifact_paths):
         raise MlflowException(
             "The specified run does not contain any evaluations. "
             "Please log evaluations to the run before retrieving them.",
             error_code=RESOURCE_DOES_NOT_EXIST,
         )
 
-    evaluations_file = client.download_artifacts(run_id=run_id, path="_evaluations.json")
-    evaluations_df = _read_evaluations_dataframe(evaluations_file)
-
-    assessments_file = client.download_artifacts(run_id=run_id, path="_assessments.json")
-    assessments_df = _read_assessments_dataframe(assessments_file)
-
-    metrics_file = client.download_artifacts(run_id=run_id, path="_metrics.json")
-    metrics_df = _read_metrics_dataframe(metrics_file)
-
-    tags_file = client.download_artifacts(run_id=run_id, path="_tags.json")
-    tags_df = _read_tags_dataframe(tags_file)
+    def download_and_read(artifact_file, read_dataframe, empty_dataframe):
+        # Empty metrics / assessments / tags tables are not logged as artifacts
+        if artifact_file not in artifact_paths:
+            return empty_dataframe()
+        return read_dataframe(client.download_artifacts(run_id=run_id, path=artifact_file))
+
+    # The four table artifacts are independent, so download and read them concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        evaluations_df, assessments_df, metrics_df, tags_df = executor.map(
+            download_and_read,
+            ["_evaluations.json", "_assessments.json", "_metrics.json", "_tags.json"],
+            [
+                _read_evaluations_dataframe,
+                _read_assessments_dataframe,
+                _read_metrics_dataframe,
+                _read_tags_dataframe,
+            ],
+            [
+                _get_empty_evaluations_dataframe,
+                _get_empty_assessments_dataframe,
+                _get_empty_metrics_dataframe,
+                _get_empty_tags_dataframe,
+            ],
+        )
 
     return _get_evaluation_from_dataframes(
         run_id=run_id,
@@ -55,10 +75,10 @@ def get_evaluation(*, run_id: str, evaluation_id: str) -> EvaluationEntity:
     )
 
 
-def _contains_evaluation_artifacts(*, client: MlflowClient, run_id: str) -> bool:
-    return {"_evaluations.json", "_metrics.json", "_assessments.json", "_tags.json"}.issubset(
-        {file.path for file in client.list_artifacts(run_id)}
-    )
+def _contains_evaluation_artifacts(*, artifact_paths: Set[str]) -> bool:
+    # Only the evaluations table is always logged; the metrics / assessments / tags tables are
+    # omitted when empty
+    return "_evaluations.json" in artifact_paths
 
 
 def _read_evaluations_dataframe(path: str) -> pd.DataFrame:
@@ -222,7 +242,9 @@ def _group_dataframe_by_evaluation_id(df: pd.DataFrame):
         Dict[str, List]: A dictionary with 'evaluation_id' as keys and lists of entity
             dictionaries as values.
     """
-    grouped = df.groupby("evaluation_id", group_keys=False).apply(
-        lambda x: x.to_dict(orient="records")
-    )
-    return grouped.to_dict()
+    # Materialize all rows in a single pass rather than via `groupby(...).apply(...)`, which
+    # invokes a Python callback and slices a sub-DataFrame per group
+    grouped = defaultdict(list)
+    for record in df.to_dict(orient="records"):
+        grouped[record["evaluation_id"]].append(record)
+    return dict(grouped)